@@ -1,4 +1,3 @@
-import os
 import pandas as pd
 import numpy as np
 import matplotlib
@@ -6,7 +5,7 @@ matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
 import seaborn as sns
 from flask import Flask, request, render_template, jsonify, send_file, Response
-from werkzeug.utils import secure_filename
+from werkzeug.exceptions import RequestEntityTooLarge
 import json
 import base64
 from io import BytesIO, StringIO
@@ -14,20 +13,40 @@ from textblob import TextBlob
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import plotly.graph_objects as go
 import plotly.express as px
-from collections import Counter
+from collections import Counter, OrderedDict
 import re
 from datetime import datetime
 import warnings
 import zipfile as zf
+import gzip
+import zlib
+import hashlib
+import threading
+from importlib.metadata import version as package_version, PackageNotFoundError
 warnings.filterwarnings('ignore')
 
+try:
+    import zstandard
+except ImportError:  # Optional: only needed for .csv.zst uploads
+    zstandard = None
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key-here'
-app.config['UPLOAD_FOLDER'] = 'uploads'
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-
-# Create necessary directories
-os.makedirs('uploads', exist_ok=True)
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload (transfer) size
+app.config['MAX_DECOMPRESSED_ROWS'] = 100000  # Max rows per upload after decompression
+app.config['CSV_CHUNK_SIZE'] = 5000  # Rows parsed and scored per chunk
+app.config['RESPONSE_CACHE_MAX_ENTRIES'] = 32
+app.config['RESPONSE_CACHE_MAX_BYTES'] = 256 * 1024 * 1024  # 256MB of cached results and charts
+app.config['TREND_DEFAULT_FREQUENCY'] = 'week'
+app.config['TREND_MAX_CATEGORIES'] = 20  # Per-category trends are dropped beyond this many categories
+
+# Supported upload formats (compressed formats are decompressed as a stream)
+ALLOWED_EXTENSIONS = ('.csv', '.csv.gz', '.csv.zst', '.zip')
+
+# Errors raised while decompressing a corrupt or truncated upload
+CORRUPT_ARCHIVE_ERRORS = (gzip.BadGzipFile, EOFError, zlib.error, zf.BadZipFile)
+if zstandard is not None:
+    CORRUPT_ARCHIVE_ERRORS += (zstandard.ZstdError,)
 
 # Initialize sentiment analyzer
 analyzer = SentimentIntensityAnalyzer()
@@ -38,6 +57,9 @@ current_charts = None
 current_insights = None
 
 class SentimentAnalysisEngine:
+    # Bump whenever the custom rule-based scoring logic changes
+    CUSTOM_SCORER_VERSION = '1'
+
     def __init__(self):
         self.positive_words = set([
             'excellent', 'outstanding', 'fantastic', 'amazing', 'brilliant', 'superb',
@@ -53,6 +75,27 @@ class SentimentAnalysisEngine:
             'horrible', 'worst', 'failed', 'disaster'
         ])
 
+        # Installed scorer package versions cannot change while the process is running
+        self.package_versions = []
+        for package in ('textblob', 'vaderSentiment'):
+            try:
+                self.package_versions.append(f'{package}={package_version(package)}')
+            except PackageNotFoundError:
+                self.package_versions.append(f'{package}=unknown')
+
+        self.refresh_scorer_version()
+
+    def refresh_scorer_version(self):
+        """Recompute the scorer fingerprint; call after modifying positive_words or negative_words"""
+        versions = list(self.package_versions)
+
+        lexicon = '|'.join(sorted(self.positive_words)) + '#' + '|'.join(sorted(self.negative_words))
+        lexicon_hash = hashlib.sha256(lexicon.encode('utf-8')).hexdigest()[:12]
+        versions.append(f'custom={self.CUSTOM_SCORER_VERSION}:{lexicon_hash}')
+
+        # Fingerprint of every scorer, used to invalidate cached results when any of them changes
+        self.scorer_version = ';'.join(versions)
+
     def analyze_sentiment_textblob(self, text):
         """TextBlob sentiment analysis"""
         blob = TextBlob(text)
@@ -136,9 +179,39 @@ class SentimentAnalysisEngine:
 
         return df.columns[0]  # Last resort
 
-    def analyze_dataset(self, df):
+    def _parses_as_datetime(self, series, threshold=0.8):
+        """Check whether most values in a sample of a column parse as dates"""
+        sample = series.dropna().astype(str).head(100)
+        sample = sample[sample.str.len() >= 6]
+        if sample.empty:
+            return False
+
+        parsed = pd.to_datetime(sample, errors='coerce', utc=True, format='mixed')
+        return parsed.notna().mean() >= threshold
+
+    def find_timestamp_column(self, df, feedback_col=None):
+        """Automatically find a datetime column, returning None if there is none"""
+        possible_names = ['date', 'time', 'timestamp', 'created', 'submitted', 'day']
+        candidates = [
+            col for col in df.columns
+            if col != feedback_col and (df[col].dtype == 'object' or pd.api.types.is_datetime64_any_dtype(df[col]))
+        ]
+
+        for col in candidates:
+            if any(name in str(col).lower() for name in possible_names) and self._parses_as_datetime(df[col]):
+                return col
+
+        # Fallback: any other column whose values are mostly dates
+        for col in candidates:
+            if self._parses_as_datetime(df[col]):
+                return col
+
+        return None
+
+    def analyze_dataset(self, df, feedback_col=None):
         """Perform comprehensive sentiment analysis on dataset"""
-        feedback_col = self.find_feedback_column(df)
+        if feedback_col is None:
+            feedback_col = self.find_feedback_column(df)
 
         if feedback_col not in df.columns:
             raise ValueError(f"Could not find feedback column: {feedback_col}")
@@ -175,6 +248,40 @@ class SentimentAnalysisEngine:
 
         return pd.DataFrame(results), feedback_col
 
+    def analyze_chunks(self, chunks, trends=None):
+        """Analyze an iterable of DataFrame chunks, scoring each as it is parsed
+
+        If a TrendAggregator is given, its time-bucketed aggregates are updated as each chunk is scored.
+        """
+        analyzed_chunks = []
+        feedback_col = None
+        row_offset = 0
+
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+
+            # Detect the feedback column once, re-detecting if a later file has a different schema
+            if feedback_col is None or feedback_col not in chunk.columns:
+                feedback_col = self.find_feedback_column(chunk)
+
+            # Keep original_index as a running row number across chunks and files
+            chunk.index = pd.RangeIndex(row_offset, row_offset + len(chunk))
+            row_offset += len(chunk)
+
+            analyzed_chunk, _ = self.analyze_dataset(chunk, feedback_col)
+            analyzed_chunks.append(analyzed_chunk)
+
+            if trends is not None:
+                if trends.timestamp_col is None:
+                    trends.set_columns(self.find_timestamp_column(chunk, feedback_col), chunk, feedback_col)
+                trends.update(analyzed_chunk)
+
+        if not analyzed_chunks:
+            return pd.DataFrame(), feedback_col
+
+        return pd.concat(analyzed_chunks, ignore_index=True), feedback_col
+
     def generate_insights(self, df):
         """Generate AI-powered insights from analysis results"""
         total_feedback = len(df)
@@ -302,17 +409,233 @@ class SentimentAnalysisEngine:
 
         return insights
 
+class TrendAggregator:
+    """Time-bucketed sentiment aggregates, maintained incrementally per engine and category
+
+    Memory grows with the number of (bucket, engine, category) groups, not with the number of rows.
+    """
+
+    FREQUENCIES = {'day': 'D', 'week': 'W', 'month': 'M'}
+
+    # Engine name -> (sentiment label column, score column or None)
+    ENGINES = {
+        'textblob': ('textblob_sentiment', 'textblob_polarity'),
+        'vader': ('vader_sentiment', 'vader_compound'),
+        'custom': ('custom_sentiment', None)
+    }
+
+    # Category key for overall totals; None cannot collide with a real (string) category value
+    ALL_CATEGORIES = None
+
+    def __init__(self, frequency, max_categories):
+        if frequency not in self.FREQUENCIES:
+            raise ValueError(f"Unsupported trend frequency '{frequency}'. Choose from: {', '.join(self.FREQUENCIES)}")
+
+        self.frequency = frequency
+        self.max_categories = max_categories
+        self.timestamp_col = None
+        self.category_col = None
+        self.categories = set()
+        self.aggregates = {}  # (engine, bucket, category) -> [count, positive, negative, neutral, score_sum]
+
+    def set_columns(self, timestamp_col, df, feedback_col):
+        """Record the detected timestamp column and pick the first remaining text column as the category"""
+        if timestamp_col is None:
+            return
+
+        self.timestamp_col = timestamp_col
+        for col in df.columns:
+            if col not in (feedback_col, timestamp_col) and df[col].dtype == 'object':
+                self.category_col = col
+                break
+
+    def update(self, analyzed_df):
+        """Fold one analyzed chunk into the running aggregates"""
+        timestamp_col = f'original_{self.timestamp_col}'
+        if self.timestamp_col is None or timestamp_col not in analyzed_df.columns:
+            return
+
+        timestamps = pd.to_datetime(analyzed_df[timestamp_col], errors='coerce', utc=True, format='mixed')
+        valid = timestamps.notna()
+        if not valid.any():
+            return
+
+        buckets = timestamps[valid].dt.tz_localize(None).dt.to_period(self.FREQUENCIES[self.frequency]).dt.start_time
+        rows = analyzed_df[valid]
+
+        group_keys = [('bucket', None)]
+        category_col = f'original_{self.category_col}' if self.category_col else None
+        if category_col is not None and category_col in rows.columns:
+            self.categories.update(rows[category_col].dropna().astype(str).unique())
+            if len(self.categories) <= self.max_categories:
+                group_keys.append(('category', rows[category_col].fillna('Unknown').astype(str)))
+            else:
+                # Too many categories to keep bounded per-category series
+                self.category_col = None
+                self.aggregates = {key: value for key, value in self.aggregates.items() if key[2] is self.ALL_CATEGORIES}
+
+        for engine, (sentiment_col, score_col) in self.ENGINES.items():
+            frame = pd.DataFrame({
+                'bucket': buckets,
+                'count': 1,
+                'positive': (rows[sentiment_col] == 'Positive').astype(int),
+                'negative': (rows[sentiment_col] == 'Negative').astype(int),
+                'neutral': (rows[sentiment_col] == 'Neutral').astype(int),
+                'score': rows[score_col] if score_col else 0.0
+            })
+
+            for key_name, key_values in group_keys:
+                if key_values is None:
+                    grouped = frame.drop(columns='bucket').groupby(frame['bucket']).sum()
+                    keys = [(bucket, self.ALL_CATEGORIES) for bucket in grouped.index]
+                else:
+                    grouped = frame.drop(columns='bucket').groupby([frame['bucket'], key_values.rename(key_name)]).sum()
+                    keys = list(grouped.index)
+
+                values = grouped[['count', 'positive', 'negative', 'neutral', 'score']].itertuples(index=False, name=None)
+                for (bucket, category), counts in zip(keys, values):
+                    aggregate = self.aggregates.setdefault((engine, bucket, category), [0, 0, 0, 0, 0.0])
+                    for i, value in enumerate(counts):
+                        aggregate[i] += value
+
+    def to_series(self):
+        """Return the aggregates as a JSON-serializable trend series, or None without a timestamp column"""
+        if self.timestamp_col is None or not self.aggregates:
+            return None
+
+        series = []
+        for (engine, bucket, category), (count, positive, negative, neutral, score_sum) in sorted(self.aggregates.items(), key=lambda item: (item[0][1], item[0][0], item[0][2] is not None, item[0][2] or '')):
+            point = {
+                'bucket': bucket.strftime('%Y-%m-%d'),
+                'engine': engine,
+                'category': category,
+                'count': int(count),
+                'positive_percent': round(positive / count * 100, 1),
+                'negative_percent': round(negative / count * 100, 1),
+                'neutral_percent': round(neutral / count * 100, 1),
+                'average_score': round(score_sum / count, 3) if self.ENGINES[engine][1] else None
+            }
+            series.append(point)
+
+        return {
+            'timestamp_column': self.timestamp_col,
+            'category_column': self.category_col,
+            'frequency': self.frequency,
+            'series': series
+        }
+
+class ResponseCache:
+    """Size-bounded LRU cache of complete analysis responses"""
+
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.scorer_version = None
+        self.lock = threading.Lock()
+
+    def _check_scorer_version(self, scorer_version):
+        """Drop every entry if the scorers changed since they were cached"""
+        if scorer_version != self.scorer_version:
+            self.entries.clear()
+            self.total_bytes = 0
+            self.scorer_version = scorer_version
+
+    def get(self, key, scorer_version):
+        with self.lock:
+            self._check_scorer_version(scorer_version)
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            self.entries.move_to_end(key)
+            return entry['value']
+
+    def put(self, key, scorer_version, value, size):
+        with self.lock:
+            self._check_scorer_version(scorer_version)
+            if size > self.max_bytes:
+                return
+
+            if key in self.entries:
+                self.total_bytes -= self.entries.pop(key)['size']
+
+            self.entries[key] = {'value': value, 'size': size}
+            self.total_bytes += size
+
+            # Evict least recently used entries until within bounds
+            while len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= evicted['size']
+
 # Initialize sentiment engine
 sentiment_engine = SentimentAnalysisEngine()
 
+# Initialize response cache
+response_cache = ResponseCache(app.config['RESPONSE_CACHE_MAX_ENTRIES'], app.config['RESPONSE_CACHE_MAX_BYTES'])
+
+def hash_upload(file):
+    """Content hash of an uploaded file, read in blocks and rewound for parsing"""
+    digest = hashlib.sha256()
+    for block in iter(lambda: file.stream.read(1024 * 1024), b''):
+        digest.update(block)
+    file.stream.seek(0)
+    return digest.hexdigest()
+
+def build_stats(analyzed_df):
+    """Summary statistics returned alongside insights and charts"""
+    return {
+        'total_feedback': len(analyzed_df),
+        'positive_percent': round((analyzed_df['textblob_sentiment'] == 'Positive').sum() / len(analyzed_df) * 100, 1),
+        'negative_percent': round((analyzed_df['textblob_sentiment'] == 'Negative').sum() / len(analyzed_df) * 100, 1),
+        'neutral_percent': round((analyzed_df['textblob_sentiment'] == 'Neutral').sum() / len(analyzed_df) * 100, 1),
+        'average_polarity': round(analyzed_df['textblob_polarity'].mean(), 3),
+        'average_subjectivity': round(analyzed_df['textblob_subjectivity'].mean(), 3)
+    }
+
+def build_cached_response(analyzed_df, trends=None):
+    """Generate insights, charts, stats and trends for an analyzed dataset as a cacheable entry"""
+    insights = sentiment_engine.generate_insights(analyzed_df)
+    charts = create_visualizations(analyzed_df)
+
+    trend_series = trends.to_series() if trends is not None else None
+    if trend_series:
+        charts['sentiment_trend'] = create_trend_chart(trend_series)
+
+    response = {
+        'analyzed_df': analyzed_df,
+        'insights': insights,
+        'charts': charts,
+        'stats': build_stats(analyzed_df),
+        'trends': trend_series
+    }
+    size = int(analyzed_df.memory_usage(deep=True).sum()) + sum(len(chart) for chart in charts.values())
+
+    return response, size
+
+def serve_cached_response(response, cached):
+    """Store a cached entry globally for downloads and return it as JSON"""
+    global current_analysis_results, current_charts, current_insights
+
+    current_analysis_results = response['analyzed_df']
+    current_charts = response['charts']
+    current_insights = response['insights']
+
+    return jsonify({
+        'success': True,
+        'cached': cached,
+        'insights': response['insights'],
+        'charts': response['charts'],
+        'stats': response['stats'],
+        'trends': response['trends']
+    })
+
 @app.route('/')
 def index():
     return render_template('index.html')
 
 @app.route('/analyze', methods=['POST'])
 def analyze_feedback():
-    global current_analysis_results, current_charts, current_insights
-
     try:
         if 'file' not in request.files:
             return jsonify({'error': 'No file uploaded'}), 400
@@ -321,126 +644,147 @@ def analyze_feedback():
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
 
-        if file and file.filename.lower().endswith('.csv'):
-            # Create unique filename
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            original_filename = secure_filename(file.filename)
-            filename = f"{timestamp}_{original_filename}"
-            filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+        if file and file.filename.lower().endswith(ALLOWED_EXTENSIONS):
+            # Key the cache on the uploaded bytes plus every option that affects the analysis
+            upload_format = next(ext for ext in ALLOWED_EXTENSIONS if file.filename.lower().endswith(ext))
+            trend_frequency = request.form.get('trend_frequency', app.config['TREND_DEFAULT_FREQUENCY'])
+            trends = TrendAggregator(trend_frequency, app.config['TREND_MAX_CATEGORIES'])
+            cache_key = f"upload:{hash_upload(file)}:{upload_format}:{app.config['CSV_CHUNK_SIZE']}:{trend_frequency}"
+            scorer_version = sentiment_engine.scorer_version
 
-            file.save(filepath)
+            cached_response = response_cache.get(cache_key, scorer_version)
+            if cached_response is not None:
+                return serve_cached_response(cached_response, cached=True)
 
-            # Read and analyze data
-            df = pd.read_csv(filepath)
+            # Stream, decompress and score the upload chunk by chunk without saving it to disk
+            chunks = iter_csv_chunks(file, app.config['CSV_CHUNK_SIZE'], app.config['MAX_DECOMPRESSED_ROWS'])
+            analyzed_df, feedback_col = sentiment_engine.analyze_chunks(chunks, trends)
 
-            if df.empty:
+            if analyzed_df.empty:
                 return jsonify({'error': 'Empty dataset'}), 400
 
-            # Perform analysis
-            analyzed_df, feedback_col = sentiment_engine.analyze_dataset(df)
-
-            # Generate insights
-            insights = sentiment_engine.generate_insights(analyzed_df)
-
-            # Create visualizations
-            charts = create_visualizations(analyzed_df)
-
-            # Store results globally for downloads
-            current_analysis_results = analyzed_df
-            current_charts = charts
-            current_insights = insights
-
-            # Clean up uploaded file
-            os.remove(filepath)
-
-            return jsonify({
-                'success': True,
-                'insights': insights,
-                'charts': charts,
-                'stats': {
-                    'total_feedback': len(analyzed_df),
-                    'positive_percent': round((analyzed_df['textblob_sentiment'] == 'Positive').sum() / len(analyzed_df) * 100, 1),
-                    'negative_percent': round((analyzed_df['textblob_sentiment'] == 'Negative').sum() / len(analyzed_df) * 100, 1),
-                    'neutral_percent': round((analyzed_df['textblob_sentiment'] == 'Neutral').sum() / len(analyzed_df) * 100, 1),
-                    'average_polarity': round(analyzed_df['textblob_polarity'].mean(), 3),
-                    'average_subjectivity': round(analyzed_df['textblob_subjectivity'].mean(), 3)
-                }
-            })
+            response, size = build_cached_response(analyzed_df, trends)
+            response_cache.put(cache_key, scorer_version, response, size)
+
+            return serve_cached_response(response, cached=False)
 
         else:
-            return jsonify({'error': 'Please upload a CSV file'}), 400
+            return jsonify({'error': 'Please upload a CSV, CSV.GZ, CSV.ZST or ZIP file'}), 400
+
+    except RequestEntityTooLarge as e:
+        return jsonify({'error': e.description}), 413
+
+    except CORRUPT_ARCHIVE_ERRORS as e:
+        return jsonify({'error': f'Invalid or corrupt archive: {str(e)}'}), 400
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
 
     except Exception as e:
         print(f"Analysis error: {str(e)}")
         return jsonify({'error': f'Analysis failed: {str(e)}'}), 500
 
+def build_demo_dataframe():
+    """Create the built-in demo dataset"""
+    demo_data = {
+        'feedback': [
+            "The workshop content was extremely comprehensive and well-structured. I learned practical skills that I can apply immediately.",
+            "Fantastic workshop! The instructor was knowledgeable and engaging. The hands-on exercises were particularly valuable.",
+            "Great learning experience with excellent real-world examples. The pace was perfect and materials were top-quality.",
+            "Outstanding workshop content and delivery. The interactive sessions made complex topics easy to understand.",
+            "Excellent workshop! Very informative and practical. The instructor answered all questions thoroughly.",
+            "The workshop was okay but felt rushed. Some topics could have been explained more clearly.",
+            "Content was good but the presentation style was quite boring. More interactive elements would help.",
+            "Average workshop. Some sections were useful but others felt repetitive and could be condensed.",
+            "The workshop was fine overall but the examples used were somewhat outdated and not very relevant.",
+            "Decent content but the delivery was monotonous. The instructor seemed unprepared for questions.",
+            "Disappointing workshop. The content was too basic and didn't meet my expectations.",
+            "Very poor experience. The workshop was disorganized and the instructor was unclear in explanations.",
+            "Terrible workshop! Complete waste of time. The material was outdated and irrelevant.",
+            "Extremely dissatisfied. The workshop lacked depth and practical applications. Very disappointing.",
+            "Awful experience. The instructor was unprofessional and the content was poorly structured.",
+            "The workshop exceeded all my expectations. Brilliant instructor with deep expertise in the subject.",
+            "Absolutely loved this workshop! Best learning experience I've had. Highly recommend to everyone.",
+            "Incredible workshop with amazing insights. The instructor's teaching style was exceptional.",
+            "Perfect balance of theory and practice. The workshop materials were excellent and well-organized.",
+            "Superb workshop! Learned so much in such a short time. The instructor was inspiring."
+        ],
+        'workshop_type': ['Data Science', 'Machine Learning', 'Python Programming', 'Leadership', 'Business Analytics'] * 4,
+        'instructor': ['Dr. Sarah Johnson', 'Prof. Michael Chen', 'Dr. Emily Rodriguez', 'Prof. David Wilson'] * 5
+    }
+
+    return pd.DataFrame(demo_data)
+
+def get_demo_response():
+    """Return the cached demo response, analyzing the demo dataset on a miss"""
+    cache_key = 'demo'
+    scorer_version = sentiment_engine.scorer_version
+
+    cached_response = response_cache.get(cache_key, scorer_version)
+    if cached_response is not None:
+        return cached_response, True
+
+    analyzed_df, feedback_col = sentiment_engine.analyze_dataset(build_demo_dataframe())
+    response, size = build_cached_response(analyzed_df)
+    response_cache.put(cache_key, scorer_version, response, size)
+
+    return response, False
+
 @app.route('/demo')
 def demo_analysis():
-    global current_analysis_results, current_charts, current_insights
-
     try:
-        # Create demo dataset
-        demo_data = {
-            'feedback': [
-                "The workshop content was extremely comprehensive and well-structured. I learned practical skills that I can apply immediately.",
-                "Fantastic workshop! The instructor was knowledgeable and engaging. The hands-on exercises were particularly valuable.",
-                "Great learning experience with excellent real-world examples. The pace was perfect and materials were top-quality.",
-                "Outstanding workshop content and delivery. The interactive sessions made complex topics easy to understand.",
-                "Excellent workshop! Very informative and practical. The instructor answered all questions thoroughly.",
-                "The workshop was okay but felt rushed. Some topics could have been explained more clearly.",
-                "Content was good but the presentation style was quite boring. More interactive elements would help.",
-                "Average workshop. Some sections were useful but others felt repetitive and could be condensed.",
-                "The workshop was fine overall but the examples used were somewhat outdated and not very relevant.",
-                "Decent content but the delivery was monotonous. The instructor seemed unprepared for questions.",
-                "Disappointing workshop. The content was too basic and didn't meet my expectations.",
-                "Very poor experience. The workshop was disorganized and the instructor was unclear in explanations.",
-                "Terrible workshop! Complete waste of time. The material was outdated and irrelevant.",
-                "Extremely dissatisfied. The workshop lacked depth and practical applications. Very disappointing.",
-                "Awful experience. The instructor was unprofessional and the content was poorly structured.",
-                "The workshop exceeded all my expectations. Brilliant instructor with deep expertise in the subject.",
-                "Absolutely loved this workshop! Best learning experience I've had. Highly recommend to everyone.",
-                "Incredible workshop with amazing insights. The instructor's teaching style was exceptional.",
-                "Perfect balance of theory and practice. The workshop materials were excellent and well-organized.",
-                "Superb workshop! Learned so much in such a short time. The instructor was inspiring."
-            ],
-            'workshop_type': ['Data Science', 'Machine Learning', 'Python Programming', 'Leadership', 'Business Analytics'] * 4,
-            'instructor': ['Dr. Sarah Johnson', 'Prof. Michael Chen', 'Dr. Emily Rodriguez', 'Prof. David Wilson'] * 5
-        }
-
-        df = pd.DataFrame(demo_data)
-
-        # Perform analysis
-        analyzed_df, feedback_col = sentiment_engine.analyze_dataset(df)
-
-        # Generate insights
-        insights = sentiment_engine.generate_insights(analyzed_df)
-
-        # Create visualizations
-        charts = create_visualizations(analyzed_df)
-
-        # Store results globally for downloads
-        current_analysis_results = analyzed_df
-        current_charts = charts
-        current_insights = insights
-
-        return jsonify({
-            'success': True,
-            'insights': insights,
-            'charts': charts,
-            'stats': {
-                'total_feedback': len(analyzed_df),
-                'positive_percent': round((analyzed_df['textblob_sentiment'] == 'Positive').sum() / len(analyzed_df) * 100, 1),
-                'negative_percent': round((analyzed_df['textblob_sentiment'] == 'Negative').sum() / len(analyzed_df) * 100, 1),
-                'neutral_percent': round((analyzed_df['textblob_sentiment'] == 'Neutral').sum() / len(analyzed_df) * 100, 1),
-                'average_polarity': round(analyzed_df['textblob_polarity'].mean(), 3),
-                'average_subjectivity': round(analyzed_df['textblob_subjectivity'].mean(), 3)
-            }
-        })
+        response, cached = get_demo_response()
+        return serve_cached_response(response, cached)
 
     except Exception as e:
         print(f"Demo error: {str(e)}")
         return jsonify({'error': f'Demo failed: {str(e)}'}), 500
 
+def iter_csv_streams(file):
+    """Yield a binary stream for every CSV in an upload, decompressing on the fly"""
+    filename = file.filename.lower()
+
+    if filename.endswith('.csv.gz'):
+        with gzip.GzipFile(fileobj=file.stream) as stream:
+            yield stream
+
+    elif filename.endswith('.csv.zst'):
+        if zstandard is None:
+            raise ValueError('Zstandard uploads require the zstandard package')
+        with zstandard.ZstdDecompressor().stream_reader(file.stream) as stream:
+            yield stream
+
+    elif filename.endswith('.zip'):
+        with zf.ZipFile(file.stream) as archive:
+            members = [
+                info for info in archive.infolist()
+                if not info.is_dir()
+                and info.filename.lower().endswith('.csv')
+                and not info.filename.startswith('__MACOSX/')
+            ]
+            if not members:
+                raise ValueError('ZIP archive does not contain any CSV files')
+
+            for info in members:
+                with archive.open(info) as stream:
+                    yield stream
+
+    else:
+        yield file.stream
+
+def iter_csv_chunks(file, chunksize, max_rows):
+    """Parse every CSV in an upload into DataFrame chunks of at most chunksize rows
+
+    Raises RequestEntityTooLarge once the upload exceeds max_rows after decompression.
+    """
+    total_rows = 0
+    for stream in iter_csv_streams(file):
+        for chunk in pd.read_csv(stream, chunksize=chunksize):
+            total_rows += len(chunk)
+            if total_rows > max_rows:
+                raise RequestEntityTooLarge(f'Upload exceeds the limit of {max_rows:,} rows after decompression')
+            yield chunk
+
 def create_visualizations(df):
     """Create all visualization charts"""
     charts = {}
@@ -586,6 +930,53 @@ def create_visualizations(df):
 
     return charts
 
+def create_trend_chart(trend_series):
+    """Create the time-bucketed sentiment trend chart"""
+    series = pd.DataFrame(trend_series['series'])
+    series['bucket'] = pd.to_datetime(series['bucket'])
+    overall = series[series['category'].isna()]
+    by_category = series[(series['engine'] == 'textblob') & series['category'].notna()]
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+
+    # Positive sentiment over time per engine
+    engine_labels = {'textblob': 'TextBlob', 'vader': 'VADER', 'custom': 'Custom'}
+    for engine, engine_series in overall.groupby('engine'):
+        ax1.plot(engine_series['bucket'], engine_series['positive_percent'], marker='o', label=engine_labels.get(engine, engine))
+
+    ax1.set_title(f"Positive Sentiment by {trend_series['frequency'].title()}", fontsize=14, fontweight='bold')
+    ax1.set_xlabel('Period', fontsize=12)
+    ax1.set_ylabel('Positive Sentiment (%)', fontsize=12)
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+    # Average TextBlob polarity over time per category
+    if not by_category.empty:
+        for category, category_series in by_category.groupby('category'):
+            ax2.plot(category_series['bucket'], category_series['average_score'], marker='o', label=category)
+        ax2.legend(fontsize=9)
+        ax2.set_title(f"Average Polarity by {trend_series['category_column']}", fontsize=14, fontweight='bold')
+    else:
+        textblob_series = overall[overall['engine'] == 'textblob']
+        ax2.plot(textblob_series['bucket'], textblob_series['average_score'], marker='o', color='#667eea')
+        ax2.set_title('Average Polarity Over Time', fontsize=14, fontweight='bold')
+
+    ax2.axhline(0, color='red', linestyle='--', alpha=0.8)
+    ax2.set_xlabel('Period', fontsize=12)
+    ax2.set_ylabel('Average Polarity', fontsize=12)
+    ax2.grid(True, alpha=0.3)
+
+    fig.autofmt_xdate()
+    plt.tight_layout()
+
+    buffer = BytesIO()
+    plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
+    buffer.seek(0)
+    chart = base64.b64encode(buffer.getvalue()).decode()
+    plt.close()
+
+    return chart
+
 @app.route('/download-charts')
 def download_charts():
     """Download all charts as a ZIP file"""
@@ -604,7 +995,8 @@ def download_charts():
                 'category_bar': 'Category_Performance_Analysis.png',
                 'polarity_hist': 'Polarity_Distribution_Chart.png',
                 'word_freq': 'Word_Frequency_Analysis.png',
-                'comparison': 'Sentiment_Method_Comparison.png'
+                'comparison': 'Sentiment_Method_Comparison.png',
+                'sentiment_trend': 'Sentiment_Trend_Analysis.png'
             }
 
             for key, base64_data in current_charts.items():
@@ -739,6 +1131,15 @@ def download_dataset():
         print(f"Dataset download error: {str(e)}")
         return jsonify({'error': 'Failed to create dataset download'}), 500
 
+def warm_demo_cache():
+    """Precompute the demo response so the first /demo request is served from cache"""
+    try:
+        get_demo_response()
+    except Exception as e:
+        print(f"Demo cache warmup error: {str(e)}")
+
+warm_demo_cache()
+
 if __name__ == '__main__':
     print("🚀 Starting Enhanced Sentiment Analysis Web Application...")
     print("📊 Flask server with Python backend")
@@ -0,0 +1,432 @@
+"""Concurrent load test for the sentiment analysis Flask endpoints.
+
+Starts app.py under gunicorn with several workers, drives /analyze, /demo and the
+three download routes from a pool of client threads, and reports throughput,
+latency percentiles, error rate and worker RSS over time.
+
+Example:
+    python load_test.py --workers 4 --concurrency 16 --duration 60 \
+        --mix analyze=4,demo=3,download-charts=1,download-insights=1,download-dataset=1 \
+        --rows 50,500,5000
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEMO_DATA_PATH = os.path.join(BASE_DIR, 'demo_data.csv')
+
+ENDPOINTS = {
+    'analyze': ('POST', '/analyze'),
+    'demo': ('GET', '/demo'),
+    'download-charts': ('GET', '/download-charts'),
+    'download-insights': ('GET', '/download-insights'),
+    'download-dataset': ('GET', '/download-dataset'),
+}
+
+DEFAULT_MIX = 'analyze=4,demo=3,download-charts=1,download-insights=1,download-dataset=1'
+
+# Download routes return 404 from a worker that has not run an analysis yet
+DOWNLOAD_ENDPOINTS = ('download-charts', 'download-insights', 'download-dataset')
+
+def parse_mix(mix):
+    """Parse 'endpoint=weight,...' into a {endpoint: weight} dict"""
+    weights = {}
+    for part in mix.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"Unknown endpoint '{name}'. Choose from: {', '.join(ENDPOINTS)}")
+        weights[name] = float(weight or 1)
+
+    if not any(weights.values()):
+        raise argparse.ArgumentTypeError('Request mix needs at least one positive weight')
+
+    return weights
+
+def parse_rows(rows):
+    """Parse a comma-separated list of positive CSV row counts"""
+    try:
+        counts = [int(count) for count in rows.split(',') if count.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Row counts must be integers, got '{rows}'")
+
+    if not counts:
+        raise argparse.ArgumentTypeError('Row counts need at least one value')
+    if any(count <= 0 for count in counts):
+        raise argparse.ArgumentTypeError('Row counts must be positive')
+
+    return counts
+
+def generate_csv(row_count, seed=0):
+    """Generate a CSV with the demo_data.csv schema by recombining its column values"""
+    with open(DEMO_DATA_PATH, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        demo_rows = list(reader)
+
+    column_values = {col: [row[col] for row in demo_rows] for col in fieldnames}
+    rng = random.Random(seed)
+
+    buffer = StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+    for _ in range(row_count):
+        writer.writerow({col: rng.choice(values) for col, values in column_values.items()})
+
+    return buffer.getvalue().encode('utf-8'), fieldnames
+
+def encode_multipart(filename, content):
+    """Encode a single file field as multipart/form-data"""
+    boundary = uuid.uuid4().hex
+    body = (
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        'Content-Type: text/csv\r\n\r\n'
+    ).encode('utf-8') + content + f'\r\n--{boundary}--\r\n'.encode('utf-8')
+
+    return body, f'multipart/form-data; boundary={boundary}'
+
+def unique_row(fieldnames):
+    """A CSV row that makes each upload distinct so it is not served from the response cache"""
+    token = uuid.uuid4().hex
+    values = [f'Load test feedback {token}'] + [''] * (len(fieldnames) - 1)
+    return (','.join(values) + '\n').encode('utf-8')
+
+def send_request(base_url, endpoint, payloads, repeat_uploads, timeout):
+    """Send one request and return (endpoint, status, latency_seconds, rows)"""
+    method, path = ENDPOINTS[endpoint]
+    data = None
+    headers = {}
+    rows = 0
+
+    if endpoint == 'analyze':
+        rows, content, fieldnames = random.choice(payloads)
+        if not repeat_uploads:
+            content = content + unique_row(fieldnames)
+        data, content_type = encode_multipart(f'load_test_{rows}.csv', content)
+        headers['Content-Type'] = content_type
+
+    req = urllib.request.Request(base_url + path, data=data, headers=headers, method=method)
+
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        e.read()
+        status = e.code
+    except Exception:
+        status = 0  # Connection error or timeout
+
+    return endpoint, status, time.perf_counter() - start, rows
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def worker_pids(master_pid):
+    """PIDs of the gunicorn workers forked by the master process (Linux /proc only)"""
+    pids = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # Field 4 (after the parenthesised command name) is the parent PID
+        ppid = int(stat.rsplit(')', 1)[1].split()[1])
+        if ppid == master_pid:
+            pids.append(int(entry))
+    return pids
+
+def read_rss_mb(pid):
+    """Resident set size of a process in MB, or None if unavailable"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+class RSSSampler(threading.Thread):
+    """Background thread sampling the RSS of every gunicorn worker"""
+
+    def __init__(self, master_pid, interval):
+        super().__init__(daemon=True)
+        self.master_pid = master_pid
+        self.interval = interval
+        self.samples = []
+        self.stop_event = threading.Event()
+        self.start_time = time.perf_counter()
+
+    def run(self):
+        while not self.stop_event.is_set():
+            rss = {}
+            for pid in worker_pids(self.master_pid):
+                value = read_rss_mb(pid)
+                if value is not None:
+                    rss[pid] = value
+            self.samples.append({'elapsed': round(time.perf_counter() - self.start_time, 1), 'rss_mb': rss})
+            self.stop_event.wait(self.interval)
+
+    def stop(self):
+        self.stop_event.set()
+        self.join()
+
+def start_server(args):
+    """Launch app.py under gunicorn and wait until it answers requests"""
+    command = [
+        sys.executable, '-m', 'gunicorn',
+        '--workers', str(args.workers),
+        '--threads', str(args.threads),
+        '--bind', f'{args.host}:{args.port}',
+        '--timeout', str(args.worker_timeout),
+        'app:app'
+    ]
+    print(f"🚀 Starting server: {' '.join(command)}")
+    process = subprocess.Popen(command, cwd=BASE_DIR)
+
+    base_url = f'http://{args.host}:{args.port}'
+    deadline = time.time() + args.startup_timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'Server exited during startup with code {process.returncode}')
+        try:
+            with urllib.request.urlopen(base_url + '/', timeout=2):
+                return process, base_url
+        except Exception:
+            time.sleep(0.5)
+
+    stop_server(process)
+    raise RuntimeError(f'Server did not become ready within {args.startup_timeout}s')
+
+def stop_server(process):
+    """Gracefully stop the gunicorn master and its workers"""
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+def prime_workers(base_url, args):
+    """Send /demo requests so every worker holds results before the timed run"""
+    prime_requests = args.prime_requests if args.prime_requests is not None else args.workers * 3
+    if prime_requests <= 0:
+        return
+
+    print(f"🔥 Priming workers with {prime_requests} /demo requests")
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = [
+            executor.submit(send_request, base_url, 'demo', [], True, args.request_timeout)
+            for _ in range(prime_requests)
+        ]
+
+    # Re-raise any exception from a priming request
+    for future in futures:
+        future.result()
+
+def run_load(base_url, args, payloads):
+    """Drive the server for the configured duration and collect per-request results"""
+    endpoints = list(args.mix)
+    weights = [args.mix[name] for name in endpoints]
+    results = []
+    results_lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    def client_loop():
+        while time.perf_counter() < deadline:
+            endpoint = random.choices(endpoints, weights=weights)[0]
+            result = send_request(base_url, endpoint, payloads, args.repeat_uploads, args.request_timeout)
+            with results_lock:
+                results.append(result)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = [executor.submit(client_loop) for _ in range(args.concurrency)]
+
+    # Fail the run if a client thread crashed rather than silently under-counting requests
+    for future in futures:
+        future.result()
+
+    return results, time.perf_counter() - start
+
+def is_not_ready(endpoint, status):
+    """A download 404 from a worker with no results yet, which is expected rather than an error"""
+    return endpoint in DOWNLOAD_ENDPOINTS and status == 404
+
+def summarize(results, elapsed):
+    """Aggregate throughput, latency percentiles and error rate per endpoint, per upload size and overall"""
+    groups = defaultdict(list)
+    for result in results:
+        endpoint, _, _, rows = result
+        groups[endpoint].append(result)
+        if endpoint == 'analyze':
+            groups[f'analyze[{rows} rows]'].append(result)
+        groups['ALL'].append(result)
+
+    summary = {}
+    for name, group in groups.items():
+        latencies = [latency * 1000 for _, _, latency, _ in group]
+        statuses = defaultdict(int)
+        for _, status, _, _ in group:
+            statuses[status] += 1
+        not_ready = sum(1 for endpoint, status, _, _ in group if is_not_ready(endpoint, status))
+        errors = sum(
+            1 for endpoint, status, _, _ in group
+            if (status == 0 or status >= 400) and not is_not_ready(endpoint, status)
+        )
+
+        summary[name] = {
+            'requests': len(group),
+            'throughput_rps': round(len(group) / elapsed, 2) if elapsed else 0.0,
+            'p50_ms': round(percentile(latencies, 50), 1),
+            'p95_ms': round(percentile(latencies, 95), 1),
+            'p99_ms': round(percentile(latencies, 99), 1),
+            'error_rate': round(errors / len(group), 4),
+            'not_ready': not_ready,
+            'status_codes': dict(statuses)
+        }
+
+    return summary
+
+def print_report(summary, rss_samples, elapsed):
+    """Print the load test report as plain-text tables"""
+    print()
+    print("📊 LOAD TEST RESULTS")
+    print("=" * 108)
+    print(f"Duration: {elapsed:.1f}s")
+    print()
+    print(f"{'Endpoint':<24}{'Requests':>10}{'RPS':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'Errors':>10}"
+          f"{'No data':>10}  Status codes")
+    print("-" * 108)
+
+    def sort_key(name):
+        # Keep per-size /analyze rows directly after /analyze, ordered by row count
+        endpoint, _, rows = name.partition('[')
+        return endpoint, int(rows.split()[0]) if rows else -1
+
+    names = sorted((name for name in summary if name != 'ALL'), key=sort_key) + ['ALL']
+    for name in names:
+        if name not in summary:
+            continue
+        stats = summary[name]
+        codes = ' '.join(f'{code}:{count}' for code, count in sorted(stats['status_codes'].items()))
+        print(f"{name:<24}{stats['requests']:>10}{stats['throughput_rps']:>10}{stats['p50_ms']:>10}"
+              f"{stats['p95_ms']:>10}{stats['p99_ms']:>10}{stats['error_rate'] * 100:>9.1f}%"
+              f"{stats['not_ready']:>10}  {codes}")
+
+    print()
+    print("Errors exclude download 404s from workers that have not run an analysis yet (shown as 'No data').")
+
+    if rss_samples:
+        print()
+        print("🧠 WORKER RSS (MB)")
+        print("-" * 108)
+        print(f"{'Elapsed s':>10}{'Workers':>10}{'Total':>12}{'Max':>12}")
+        for sample in rss_samples:
+            values = list(sample['rss_mb'].values())
+            total = sum(values)
+            peak = max(values) if values else 0.0
+            print(f"{sample['elapsed']:>10}{len(values):>10}{total:>12.1f}{peak:>12.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Concurrent load test for the sentiment analysis app')
+    parser.add_argument('--url', help='Target an already running server instead of starting one (RSS is not sampled)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=4, help='gunicorn worker processes')
+    parser.add_argument('--threads', type=int, default=1, help='Threads per gunicorn worker')
+    parser.add_argument('--worker-timeout', type=int, default=300, help='gunicorn worker timeout in seconds')
+    parser.add_argument('--startup-timeout', type=int, default=180, help='Seconds to wait for the server to come up')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent client threads')
+    parser.add_argument('--duration', type=float, default=30, help='Seconds to generate load')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f'Weighted request mix (default: {DEFAULT_MIX})')
+    parser.add_argument('--rows', type=parse_rows, default=parse_rows('20,200,2000'),
+                        help='Comma-separated CSV row counts for /analyze uploads')
+    parser.add_argument('--repeat-uploads', action='store_true',
+                        help='Send identical bytes for each row count so uploads hit the response cache')
+    parser.add_argument('--prime-requests', type=int, default=None,
+                        help='/demo requests sent before the timed run so workers hold results (default: 3 per worker)')
+    parser.add_argument('--request-timeout', type=float, default=300, help='Per-request timeout in seconds')
+    parser.add_argument('--sample-interval', type=float, default=2, help='Seconds between worker RSS samples')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for generated CSV content')
+    parser.add_argument('--json', dest='json_path', help='Also write the full report as JSON to this path')
+    args = parser.parse_args()
+
+    payloads = []
+    for row_count in args.rows:
+        content, fieldnames = generate_csv(row_count, seed=args.seed + row_count)
+        payloads.append((row_count, content, fieldnames))
+        print(f"📁 Generated {row_count}-row CSV ({len(content) / 1024:.1f} KB)")
+
+    process = None
+    sampler = None
+    try:
+        if args.url:
+            base_url = args.url.rstrip('/')
+        else:
+            process, base_url = start_server(args)
+            sampler = RSSSampler(process.pid, args.sample_interval)
+            sampler.start()
+
+        prime_workers(base_url, args)
+
+        print(f"🌐 Driving {base_url} with {args.concurrency} clients for {args.duration:.0f}s")
+        results, elapsed = run_load(base_url, args, payloads)
+    finally:
+        if sampler is not None:
+            sampler.stop()
+        if process is not None:
+            stop_server(process)
+
+    summary = summarize(results, elapsed)
+    rss_samples = sampler.samples if sampler is not None else []
+    print_report(summary, rss_samples, elapsed)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'config': {
+                    'url': base_url,
+                    'workers': None if args.url else args.workers,
+                    'threads': None if args.url else args.threads,
+                    'concurrency': args.concurrency,
+                    'duration': args.duration,
+                    'mix': args.mix,
+                    'rows': args.rows,
+                    'repeat_uploads': args.repeat_uploads
+                },
+                'elapsed': elapsed,
+                'summary': summary,
+                'rss_samples': rss_samples
+            }, f, indent=2, default=str)
+        print(f"\n💾 Report written to {args.json_path}")
+
+if __name__ == '__main__':
+    main()
@@ -56,8 +56,9 @@ class FullStackSentimentApp {
     }
 
     async handleFileUpload(file) {
-        if (!file.name.toLowerCase().endsWith('.csv')) {
-            this.showError('Please upload a CSV file.');
+        const allowedExtensions = ['.csv', '.csv.gz', '.csv.zst', '.zip'];
+        if (!allowedExtensions.some(ext => file.name.toLowerCase().endsWith(ext))) {
+            this.showError('Please upload a CSV, CSV.GZ, CSV.ZST or ZIP file.');
             return;
         }
 
@@ -72,6 +73,7 @@ class FullStackSentimentApp {
 
         const formData = new FormData();
         formData.append('file', file);
+        formData.append('trend_frequency', document.getElementById('trendFrequency').value);
 
         try {
             const response = await fetch('/analyze', {
@@ -244,7 +246,8 @@ class FullStackSentimentApp {
             'category_bar': 'Category Performance',
             'polarity_hist': 'Polarity Distribution',
             'word_freq': 'Word Frequency Analysis',
-            'comparison': 'Method Comparison'
+            'comparison': 'Method Comparison',
+            'sentiment_trend': 'Sentiment Trends'
         };
 
         Object.entries(charts).forEach(([key, base64Data]) => {